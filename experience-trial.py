@@ -1,14 +1,16 @@
 import re
 
 
-def extract_experience_text(text):
-    # Define the regex pattern
-    experience_text_pattern = re.compile(
-        r"(EXPERIENCE|Experience|Projects Undertaken:|PROJECTS UNDERTAKEN|Projects:|PROJECTS|PROJECTS:|Work Experience:|EMPLOYMENT HISTORY|Projects|Project Details:)\n([{L}\s\S]*?)(?=\n(?:SKILLS|Skills|Professional Skills|Personal Qualities:|PERSONAL QUALITIES:|Personal Qualities|PERSONAL QUALITIES|Education|EDUCATION|$))",
-    )
+# Define the regex pattern once, case-insensitive so each header is listed only once
+EXPERIENCE_TEXT_PATTERN = re.compile(
+    r"(experience|projects undertaken:?|projects:?|work experience:?|employment history|project details:)\n([\s\S]*?)(?=\n(?:skills|professional skills|personal qualities|education|$))",
+    flags=re.IGNORECASE,
+)
+
 
+def extract_experience_text(text):
     # Search for the first profile pattern in the text
-    match = experience_text_pattern.search(text)
+    match = EXPERIENCE_TEXT_PATTERN.search(text)
 
     # If a match is found, return the content after the first PROFILE paragraph
     return match[2].strip() if match else None
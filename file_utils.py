@@ -0,0 +1,51 @@
+"""
+Contains helpers for writing files.
+
+List of functions:
+- atomic_write(output_file: str) -> Iterator[BinaryIO]: Opens a temporary file that replaces the output file once it is written.
+
+"""
+
+import os
+import stat
+import tempfile
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator
+
+# Read once at import, os.umask can only be read by setting it, which is not thread safe
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+@contextmanager
+def atomic_write(output_file: str) -> Iterator[BinaryIO]:
+    """
+    Opens a temporary file next to the output file and moves it over the output file once written.
+
+    Readers never see a partly written file. The output file keeps its permissions, or gets
+    the ones open() would give a new file, and the temporary file is removed if writing fails.
+
+    Args:
+        output_file (str): The path to save the content to. It may also be the file being read.
+
+    Yields:
+        BinaryIO: The temporary file, opened in binary mode.
+    """
+    fd, temp_file = tempfile.mkstemp(dir=os.path.dirname(output_file) or ".")
+    try:
+        with os.fdopen(fd, "wb") as out_file:
+            yield out_file
+
+        # mkstemp creates the file readable by its owner only
+        try:
+            mode = stat.S_IMODE(os.stat(output_file).st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(temp_file, mode)
+        os.replace(temp_file, output_file)
+    except BaseException:
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+        raise
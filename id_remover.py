@@ -1,10 +1,15 @@
-import json
+import ijson
+import orjson
+
+from file_utils import atomic_write
 
 
 def remove_id_key(input_file, output_file):
     """
     Remove the "id" key from each entry in the input JSON file and save the modified data to the output file.
 
+    Entries are streamed one at a time, so only a single entry is held in memory.
+
     Args:
         input_file (str): The path to the input JSON file.
         output_file (str): The path to the output JSON file.
@@ -14,15 +19,16 @@ def remove_id_key(input_file, output_file):
 
     """
     try:
-        with open(input_file, "r") as json_file:
-            data = json.load(json_file)
-
-        # Remove the "id" key from each entry
-        for item in data:
-            item.pop("_id", None)
-
-        with open(output_file, "w") as json_file:
-            json.dump(data, json_file, indent=2)
+        # Write next to the output first, the input and output may be the same file,
+        # so the input is closed before the output replaces it
+        with atomic_write(output_file) as out_file, open(input_file, "rb") as in_file:
+            separator = b"[\n"
+            for item in ijson.items(in_file, "item", use_float=True):
+                # Remove the "id" key from each entry
+                item.pop("_id", None)
+                out_file.write(separator + orjson.dumps(item))
+                separator = b",\n"
+            out_file.write(b"[]\n" if separator == b"[\n" else b"\n]\n")
 
         print(f"'id' key removed. Modified data saved to {output_file}")
     except Exception as e:
@@ -15,15 +15,8 @@ def extract_text(pdf_path):
     """
     try:
         with pdfplumber.open(pdf_path) as pdf:
-            text = ""
-
-            for page_num in range(len(pdf.pages)):
-                page = pdf.pages[page_num]
-
-                # Extract text with layout information
-                text += page.extract_text()
-
-        return text
+            # Extract text with layout information, joined once at the end
+            return "".join(page.extract_text() or "" for page in pdf.pages)
 
     except Exception as e:
         print(f"Error: {e}")
@@ -6,28 +6,37 @@ and extracting information from it.
 
 import asyncio
 import hashlib
-import json
+import io
 import os
 import re
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from operator import itemgetter
-from typing import Any, Dict, Literal
+from typing import Any, Dict, Hashable, Literal
 
 import httpx
+import orjson
 from flask import Flask, Response, jsonify, request
 from flask_compress import Compress  # type: ignore
 from flask_cors import CORS
 from werkzeug.datastructures import FileStorage
 from werkzeug.utils import secure_filename
 
+from file_utils import atomic_write
 from main_config import (
+    NAME_NOISE_PATTERN,
     NAME_PATTERN,
+    NON_ASCII_PATTERN,
     URL_TO_FETCH_DESIGNATION,
     URL_TO_FETCH_SKILL,
+    extract_designations,
     extract_email,
     extract_experience_duration,
     extract_experience_text,
     extract_phone,
+    extract_skills,
     extract_summary_text,
 )
 from pdf_utils import extract_text_line_by_line
@@ -39,6 +48,81 @@ os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 app.config["UPLOAD_FOLDER"] = UPLOAD_FOLDER
 Compress(app)
 
+# How long downloaded skills/designations stay fresh before revalidating
+REMOTE_DATA_TTL_SECONDS = 300
+
+# url -> (expiry, deduplicated data, conditional request headers, content hash)
+_REMOTE_CACHE: dict[str, tuple[float, list[Any], dict[str, str], str]] = {}
+
+# Maximum number of extracted resumes kept in memory
+RESUME_CACHE_SIZE = 1024
+
+# PDF content hash and remote data version -> extracted information, least recently used first
+_RESUME_CACHE: OrderedDict[str, Any] = OrderedDict()
+_RESUME_CACHE_LOCK = threading.Lock()
+
+
+def _http_client() -> httpx.AsyncClient:
+    """
+    Creates the HTTP client shared by the requests made while handling one view.
+
+    httpx connections cannot be reused across event loops, and Flask runs each
+    async view in a fresh loop, so the client is not shared between views. The view
+    opens it as an async context manager, so its connections are closed with it.
+
+    Returns:
+        httpx.AsyncClient: A new client.
+    """
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(30.0),
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    )
+
+
+def _hash_pdf(pdf_bytes: bytes) -> str:
+    """
+    Hashes the content of a PDF file to key the resume cache.
+
+    Args:
+        pdf_bytes (bytes): The content of the PDF file.
+
+    Returns:
+        str: The hex digest of the content.
+    """
+    return hashlib.blake2b(pdf_bytes, digest_size=16).hexdigest()
+
+
+def _get_cached_resume(resume_key: str) -> Any | None:
+    """
+    Looks up the information extracted earlier from a PDF with the same content.
+
+    Args:
+        resume_key (str): The hash of the PDF content and the version of the remote data.
+
+    Returns:
+        Any | None: The extracted information, or None if the PDF was not seen recently with the same remote data.
+    """
+    with _RESUME_CACHE_LOCK:
+        extracted_info = _RESUME_CACHE.get(resume_key)
+        if extracted_info is not None:
+            _RESUME_CACHE.move_to_end(resume_key)
+        return extracted_info
+
+
+def _cache_resume(resume_key: str, extracted_info: Any) -> None:
+    """
+    Stores the information extracted from a PDF, evicting the least recently used entry when full.
+
+    Args:
+        resume_key (str): The hash of the PDF content and the version of the remote data.
+        extracted_info (Any): The extracted information.
+    """
+    with _RESUME_CACHE_LOCK:
+        _RESUME_CACHE[resume_key] = extracted_info
+        _RESUME_CACHE.move_to_end(resume_key)
+        if len(_RESUME_CACHE) > RESUME_CACHE_SIZE:
+            _RESUME_CACHE.popitem(last=False)
+
 
 class PdfProcessor:
     """
@@ -47,38 +131,46 @@ class PdfProcessor:
 
     @staticmethod
     async def download_pdf_from_url(
-        pdf_url: str, local_path: str, timeout_seconds: int = 30
-    ) -> None:
+        client: httpx.AsyncClient,
+        pdf_url: str,
+        local_path: str,
+        timeout_seconds: int = 30,
+    ) -> str:
         """
         Downloads a PDF file from the given URL and saves it to the specified local path.
 
         Args:
+            client (httpx.AsyncClient): The client of the view, as created by _http_client.
             pdf_url (str): The URL of the PDF file to download.
             local_path (str): The local path where the downloaded PDF file will be saved.
             timeout_seconds (int, optional): The timeout value in seconds for the download request. Defaults to 30.
 
+        Returns:
+            str: The hash of the downloaded content, as computed by _hash_pdf.
+
         Raises:
             httpx.HTTPStatusError: If the download request fails with a non-successful status code.
         """
-        async with httpx.AsyncClient() as client:
-            async with client.stream(
-                "GET", pdf_url, timeout=timeout_seconds
-            ) as response:
-                response.raise_for_status()
-                with open(local_path, "wb") as local_pdf_file:
-                    async for chunk in response.aiter_bytes():
-                        local_pdf_file.write(chunk)
+        pdf_hash = hashlib.blake2b(digest_size=16)
+        async with client.stream("GET", pdf_url, timeout=timeout_seconds) as response:
+            response.raise_for_status()
+            with open(local_path, "wb") as local_pdf_file:
+                # 64 KiB chunks are larger than the file buffer, so each is one write call
+                async for chunk in response.aiter_bytes(chunk_size=65536):
+                    local_pdf_file.write(chunk)
+                    pdf_hash.update(chunk)
+        return pdf_hash.hexdigest()
 
     @staticmethod
-    async def process_pdf(
-        pdf_url: str, filename: str
+    def process_pdf(
+        local_pdf_path: str, pdf_hash: str | None = None
     ) -> dict[str, str | list[str] | None]:
         """
-        Downloads a PDF file from the given URL, processes it, and extracts information from it.
+        Processes a downloaded PDF file and extracts information from it.
 
         Args:
-            pdf_url (str): The URL of the PDF file to process.
-            filename (str): The name of the PDF file.
+            local_pdf_path (str): The local path of the downloaded PDF file.
+            pdf_hash (str | None, optional): The hash of the PDF content, to cache the extracted lines by. Defaults to None.
 
         Returns:
             dict[str, str | list[str] | None]: A dictionary containing the extracted information from the PDF.
@@ -87,10 +179,7 @@ class PdfProcessor:
                 - 'content': The extracted elements from the PDF.
                 - 'timestamp': The timestamp when the processing was performed.
         """
-        local_pdf_path = os.path.join("resume-data", filename, f"{filename}.pdf")
-
-        await PdfProcessor.download_pdf_from_url(pdf_url, local_pdf_path)
-        elements = extract_text_line_by_line(local_pdf_path)
+        elements = extract_text_line_by_line(local_pdf_path, pdf_hash)
         return PdfProcessor.extract_information(elements)
 
     @staticmethod
@@ -118,7 +207,7 @@ class PdfProcessor:
 
 
 def check_and_collect_skills(
-    text_content: str, json_data: list[Any] | None
+    text_content: str, json_data: list[Any] | None, text_content_lc: str | None = None
 ) -> list[Any] | None:
     """
     Check and collect skills from the given text content based on the provided JSON data.
@@ -126,25 +215,19 @@ def check_and_collect_skills(
     Args:
         text_content (str): The text content to search for skills.
         json_data (list[Any] | None): The JSON data containing skills information.
+        text_content_lc (str | None, optional): The text content already lowercased. Defaults to None.
 
     Returns:
         list[Any] | None: A list of skills found in the text content, or None if no JSON data is provided.
     """
     title_getter = itemgetter("title")
     if json_data:
-        return [
-            title_getter(item)
-            for item in json_data
-            if re.search(
-                r"\b{}\b".format(re.escape(title_getter(item))),
-                text_content,
-                re.IGNORECASE,
-            )
-        ]
+        all_skills = [title_getter(item) for item in json_data]
+        return extract_skills(text_content, all_skills, text_content_lc)
 
 
 def check_and_collect_designation_ids(
-    text_content: str, json_data: list[Any] | None
+    text_content: str, json_data: list[Any] | None, text_content_lc: str | None = None
 ) -> tuple[list[Any], Any | Literal[""]]:
     """
     Check and collect designation IDs based on the given text content and JSON data.
@@ -152,6 +235,7 @@ def check_and_collect_designation_ids(
     Args:
         text_content (str): The text content to search for designations.
         json_data (list[Any] | None): The JSON data containing designation information.
+        text_content_lc (str | None, optional): The text content already lowercased. Defaults to None.
 
     Returns:
         tuple[list[Any], list[Any], Any | Literal[""]]: A tuple containing the following:
@@ -164,31 +248,9 @@ def check_and_collect_designation_ids(
     # Extract all designations from the JSON data
     all_designations = [title_getter(item) for item in json_data]
 
-    # Use list comprehensions for a more concise style
-    matching_designations = [
-        designation
-        for designation in all_designations
-        if re.search(
-            r"\b{}\b".format(re.escape(designation)), text_content, re.IGNORECASE
-        )
-    ]
-
-    # Sort the matching designations based on their appearance in the text
-    sorted_designations = sorted(
-        matching_designations,
-        key=lambda designation: (
-            min(
-                (
-                    match.start()
-                    for match in re.finditer(
-                        r"\b{}\b".format(re.escape(designation)),
-                        text_content,
-                        re.IGNORECASE,
-                    )
-                ),
-                default=float("inf"),
-            )
-        ),
+    # Scan the text once for every designation, sorted by first appearance
+    sorted_designations = extract_designations(
+        text_content, all_designations, text_content_lc
     )
 
     # Check if matching_designations list is not empty before accessing its first element
@@ -208,79 +270,101 @@ async def send_json_to_api(filename: str) -> Any:
     Returns:
         Any: The JSON data extracted from the file.
     """
-    with open(f"{filename}_extracted_info.json", "r") as json_file:
-        json_data = json.load(json_file)
+    with open(f"{filename}_extracted_info.json", "rb") as json_file:
+        json_data = orjson.loads(json_file.read())
     return json_data
 
 
-async def save_url_as_json_async(url: str, output_file: str) -> list[Any] | None:
+async def _fetch_remote_json(
+    client: httpx.AsyncClient, url: str, output_file: str
+) -> tuple[list[Any] | None, str]:
     """
-    Fetches data from the given URL and saves it as a JSON file.
+    Fetches data from the given URL, saves it as a JSON file and identifies its version.
 
     Args:
+        client (httpx.AsyncClient): The client of the view, as created by _http_client.
         url (str): The URL to fetch the data from.
         output_file (str): The path to save the JSON file.
 
     Returns:
-        list[Any] | None: The fetched data as a list of any type, or None if there was an error.
-
-    Raises:
-        httpx.RequestError: If there was an error fetching the data.
+        tuple[list[Any] | None, str]: The fetched data, or None if there was an error, and
+            the hash of the content it was parsed from.
     """
+    cached = _REMOTE_CACHE.get(url)
+    if cached and time.monotonic() < cached[0]:
+        return cached[1], cached[3]
+
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-
-            if response.status_code != 200:
-                print(f"Error: Unexpected response status {response.status_code}")
-                if os.path.exists(output_file):
-                    with open(output_file, "r") as json_file:
-                        data = json.load(json_file)
-                        print(f"Data loaded from local {output_file}")
-                        # Remove duplicates based on hash
-                        data = remove_duplicates(data=data)
-                    return data
-
-                else:
-                    print(f"Error: Local {output_file} not found")
-                    return None
-            response.raise_for_status()
+        response = await client.get(url, headers=cached[2] if cached else None)
 
-            with open(output_file, "wb") as json_file:
-                json_file.write(response.content)
-                hash_md5 = hashlib.md5()
-                hash_md5.update(response.content)
-                downloaded_hash = hash_md5.hexdigest()
+        if response.status_code == 304 and cached:
+            # Not modified, keep the data and validators we already have
+            _REMOTE_CACHE[url] = (
+                time.monotonic() + REMOTE_DATA_TTL_SECONDS,
+                *cached[1:],
+            )
+            return cached[1], cached[3]
 
+        if response.status_code != 200:
+            print(f"Error: Unexpected response status {response.status_code}")
             if os.path.exists(output_file):
-                with open(output_file, "rb") as local_json_file:
-                    hash_md5 = hashlib.md5()
-                    hash_md5.update(local_json_file.read())
-                    local_hash = hash_md5.hexdigest()
-
-            else:
-                local_hash = None
-
-            if downloaded_hash == local_hash:
-                with open(output_file, "r") as json_file:
-                    data = json.load(json_file)
+                with open(output_file, "rb") as json_file:
+                    content = json_file.read()
+                    data = orjson.loads(content)
                     print(f"Data loaded from local {output_file}")
                     # Remove duplicates based on hash
-                    data = remove_duplicates(data)
-                return data
-
-            data = response.json()
-
-            with open(output_file, "w") as json_file:
-                json.dump(data, json_file, indent=2)
+                    data = remove_duplicates(data=data)
+                return data, hashlib.blake2b(content, digest_size=16).hexdigest()
 
+            else:
+                print(f"Error: Local {output_file} not found")
+                return None, ""
+        response.raise_for_status()
+
+        content_hash = hashlib.blake2b(response.content, digest_size=16).hexdigest()
+        if cached and cached[3] == content_hash:
+            # Same payload as last time, no need to parse, dedupe or save it again
+            data = cached[1]
+        else:
+            # Remove duplicates based on content
+            data = remove_duplicates(orjson.loads(response.content))
+            with atomic_write(output_file) as json_file:
+                json_file.write(response.content)
             print(f"Data saved successfully to {output_file}")
-            # Remove duplicates based on hash
-            data = remove_duplicates(data)
-            return data
+            # Resumes cached so far were matched against the old data and can no longer be hit
+            with _RESUME_CACHE_LOCK:
+                _RESUME_CACHE.clear()
+
+        _remember_remote_data(url, response, data, content_hash)
+        return data, content_hash
     except httpx.RequestError as e:
         print(f"Error fetching data: {e}")
-    return None
+    return None, ""
+
+
+def _remember_remote_data(
+    url: str, response: httpx.Response, data: list[Any], content_hash: str
+) -> None:
+    """
+    Caches the fetched data along with the validators needed to revalidate it.
+
+    Args:
+        url (str): The URL the data was fetched from.
+        response (httpx.Response): The response the data came from.
+        data (list[Any]): The deduplicated data.
+        content_hash (str): The hash of the response body.
+    """
+    validators = {}
+    if etag := response.headers.get("ETag"):
+        validators["If-None-Match"] = etag
+    if last_modified := response.headers.get("Last-Modified"):
+        validators["If-Modified-Since"] = last_modified
+    _REMOTE_CACHE[url] = (
+        time.monotonic() + REMOTE_DATA_TTL_SECONDS,
+        data,
+        validators,
+        content_hash,
+    )
 
 
 def remove_duplicates(data) -> list[Any]:  # type: ignore
@@ -297,48 +381,86 @@ def remove_duplicates(data) -> list[Any]:  # type: ignore
     result = []
 
     for item in data:  # type: ignore
-        item_hash = hashlib.md5(json.dumps(item, sort_keys=True).encode()).hexdigest()
-        if item_hash not in unique_items:
-            unique_items.add(item_hash)  # type: ignore
+        item_key = _dedupe_key(item)
+        if item_key not in unique_items:
+            unique_items.add(item_key)  # type: ignore
             result.append(item)  # type: ignore
 
     return result  # type: ignore
 
 
+def _dedupe_key(item: Any) -> Hashable:
+    """
+    Builds a hashable key identifying an item by its content.
+
+    Args:
+        item (Any): The item to build the key for.
+
+    Returns:
+        Hashable: The sorted key/type/value triples for flat dicts, or the canonical JSON otherwise.
+    """
+    if isinstance(item, dict):
+        # 1, 1.0 and True are equal and hash alike, but are different JSON values
+        key = tuple(sorted((k, type(v), v) for k, v in item.items()))  # type: ignore
+        try:
+            hash(key)
+            return key
+        except TypeError:
+            pass  # Nested values, fall back to JSON
+    return orjson.dumps(item, option=orjson.OPT_SORT_KEYS)
+
+
 def extract_name(
-    text_content: str, json_data: list[Any] | None
+    text_content: str,
+    json_data: list[Any] | None,
+    designations: list[Any] | None = None,
 ) -> (
     tuple[str | Any, str | Any]
     | tuple[str, Literal[""]]
     | tuple[Literal[""], Literal[""]]
 ):
-    (
-        designations,
-        _,
-    ) = check_and_collect_designation_ids(text_content, json_data)
+    """
+    Extracts the first name and surname from the given text content.
+
+    Args:
+        text_content (str): The text content to extract the name from.
+        json_data (list[Any] | None): The JSON data containing designation information.
+        designations (list[Any] | None, optional): The designations already found in the text content,
+            to skip scanning for them again. Defaults to None.
+
+    Returns:
+        tuple[str, str]: The name and surname, either of which may be an empty string.
+    """
+    if designations is None:
+        designations, _ = check_and_collect_designation_ids(text_content, json_data)
 
     email = extract_email(text_content)
 
     # Titlecase the designation and add to the list
     cleaned_text = text_content
-    for item_ in designations:
-        cleaned_text = cleaned_text.replace(item_, "").replace("–", "").strip()
+    if designations:
+        # Remove all designations in one pass, longest first so overlapping ones go whole
+        designation_pattern = re.compile(
+            "|".join(
+                re.escape(designation)
+                for designation in sorted(set(designations), key=len, reverse=True)
+            )
+        )
+        cleaned_text = designation_pattern.sub("", cleaned_text)
+        cleaned_text = cleaned_text.replace("–", "").strip()
         if email:
             cleaned_text = cleaned_text.replace(email, "").replace(":", "").strip()
 
         cleaned_text = "\n".join(line.strip() for line in cleaned_text.split("\n"))
 
     # Search for the pattern in the cleaned text
-    cleaned_text = re.sub(r"\bLinkedIn\b", "", cleaned_text, flags=re.IGNORECASE)
-    cleaned_text = re.sub(
-        r"\b\w+\.vercel\.app\b", "", cleaned_text, flags=re.IGNORECASE
-    )
+    cleaned_text = NAME_NOISE_PATTERN.sub("", cleaned_text)
     cleaned_text = cleaned_text.replace("|", " ").replace("Resume", "")
     # print(cleaned_text)
     phone = extract_phone(cleaned_text)
     if phone:
         cleaned_text = cleaned_text.replace(phone, "").replace("+", "").strip()
-    match = NAME_PATTERN.search(string=cleaned_text)
+    match = NAME_PATTERN.search(cleaned_text)
 
     # Check if conditions are met
     if (
@@ -375,7 +497,10 @@ def remove_unrecognized_characters(text: str | Any | None) -> str | None:
         str | None: The processed text with unrecognized characters removed, or None if the input text is None.
     """
     if text:
-        return re.sub(r"[^\x00-\x7F]+", " ", text).replace("\n", " ").strip()
+        # Most lines are plain ASCII, only run the regex when there is something to replace
+        if not text.isascii():
+            text = NON_ASCII_PATTERN.sub(" ", text)
+        return text.replace("\n", " ").strip()
 
 
 async def check_titles_and_extract_info(
@@ -399,8 +524,19 @@ async def check_titles_and_extract_info(
             file_content = text_file.read()
             "Summary Adaptable Computer Engineer With Extensive Experience In Development Using React"
 
+            # Lowercase once for both keyword scans
+            file_content_lc = file_content.lower()
+            (
+                designations,
+                designation_title,
+            ) = check_and_collect_designation_ids(
+                file_content, json_designations, text_content_lc=file_content_lc
+            )
+
             firstName, lastName = extract_name(
-                text_content=file_content, json_data=json_designations
+                text_content=file_content,
+                json_data=json_designations,
+                designations=designations,
             )
             # print(firstName, lastName)
             # use fstring to combine firstName and lastName
@@ -411,43 +547,40 @@ async def check_titles_and_extract_info(
             amount_of_experience, duration_string = extract_experience_duration(
                 file_content
             )
-            skills = check_and_collect_skills(file_content, json_skills)
-
-            (
-                designations,
-                designation_title,
-            ) = check_and_collect_designation_ids(file_content, json_designations)
+            skills = check_and_collect_skills(
+                file_content, json_skills, text_content_lc=file_content_lc
+            )
             work_experience = extract_experience_text(file_content)
 
-            with open(f"{text_file_path}_extracted_info.json", "w") as json_file:
-                json.dump(
-                    {
-                        "name": name.title() or "",
-                        "email": email or "",
-                        "phone": phone or "",
-                        "skills": sorted(list(set(skills))) or [],  # type: ignore
-                        "designation": designations or [],
-                        "experience": [
-                            {
-                                # return first element in set, if empty return empty list
-                                "title": designation_title or "",
-                                "amount_of_experience": amount_of_experience or 0,
-                                "duration_string": remove_unrecognized_characters(
-                                    duration_string
-                                )
-                                or "",
-                                "summary": remove_unrecognized_characters(summary)
-                                or "",
-                            }
-                        ],
-                        "work_experience": remove_unrecognized_characters(
-                            work_experience
-                        )
-                        or "",
-                    },
-                    json_file,
-                    indent=2,
-                    sort_keys=True,
+            with open(f"{text_file_path}_extracted_info.json", "wb") as json_file:
+                json_file.write(
+                    orjson.dumps(
+                        {
+                            "name": name.title() or "",
+                            "email": email or "",
+                            "phone": phone or "",
+                            "skills": sorted(list(set(skills))) or [],  # type: ignore
+                            "designation": designations or [],
+                            "experience": [
+                                {
+                                    # return first element in set, if empty return empty list
+                                    "title": designation_title or "",
+                                    "amount_of_experience": amount_of_experience or 0,
+                                    "duration_string": remove_unrecognized_characters(
+                                        duration_string
+                                    )
+                                    or "",
+                                    "summary": remove_unrecognized_characters(summary)
+                                    or "",
+                                }
+                            ],
+                            "work_experience": remove_unrecognized_characters(
+                                work_experience
+                            )
+                            or "",
+                        },
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS,
+                    )
                 )
             # print(
             #     f"Name: {name}, Email: {email}, Phone: {phone}, Skills: {skills}, Summary: {remove_unrecognized_characters(summary)}, designation: {next(iter(set(designation)), '')}, Experience: {years_of_experience}, Work Experience: {remove_unrecognized_characters(work_experience)}"
@@ -456,12 +589,16 @@ async def check_titles_and_extract_info(
         print(f"Error: File '{text_file_path}' not found.")
 
 
-def process_uploaded_file(file: FileStorage) -> tuple[list[str] | None, str]:
+def process_uploaded_file(
+    file: FileStorage, pdf_bytes: bytes, pdf_hash: str | None = None
+) -> tuple[list[str] | None, str]:
     """
     Process the uploaded file and extract text line by line.
 
     Args:
         file (FileStorage): The uploaded file.
+        pdf_bytes (bytes): The content of the uploaded file, already read from its stream.
+        pdf_hash (str | None, optional): The hash of the content, to cache the extracted lines by. Defaults to None.
 
     Returns:
         tuple[list[str] | None, str]: A tuple containing the extracted elements as a list of strings
@@ -469,9 +606,12 @@ def process_uploaded_file(file: FileStorage) -> tuple[list[str] | None, str]:
     """
     filename = secure_filename(file.filename or "no_file")
     file_path = os.path.join(app.config["UPLOAD_FOLDER"], filename)  # type:ignore
-    file.save(file_path)  # type:ignore
 
-    elements = extract_text_line_by_line(file_path)
+    # Parse the upload from memory instead of reading back the saved copy
+    with open(file_path, "wb") as local_pdf_file:
+        local_pdf_file.write(pdf_bytes)
+
+    elements = extract_text_line_by_line(io.BytesIO(pdf_bytes), pdf_hash)
 
     return elements, filename
 
@@ -494,47 +634,124 @@ async def extract_data() -> (
         - If there is an error fetching or processing the PDF, returns a tuple with the response and status code 500.
     """
     try:
-        if "file" in request.files:
-            file: FileStorage = request.files["file"]
-            file_name = file.filename.strip(".pdf") if file.filename else "no_file"
-            os.makedirs(f"resume-data/{file_name}", exist_ok=True)
-            elements, filename = process_uploaded_file(file)  # type:ignore
+        # One client for the view, so its requests share connections
+        async with _http_client() as client:
+            if "file" in request.files:
+                file: FileStorage = request.files["file"]
+                pdf_bytes = file.read()
+                # Resumes are matched against the remote data, so its version is part of the key
+                json_skills, json_designations, data_version = await fetch_remote_data(
+                    client
+                )
+                pdf_hash = _hash_pdf(pdf_bytes)
+                resume_key = f"{pdf_hash}:{data_version}"
+                if (extracted_info := _get_cached_resume(resume_key)) is not None:
+                    return extracted_info
+
+                file_name = file.filename.strip(".pdf") if file.filename else "no_file"
+                os.makedirs(f"resume-data/{file_name}", exist_ok=True)
+                elements, filename = process_uploaded_file(  # type:ignore
+                    file, pdf_bytes, pdf_hash
+                )
 
-            extracted_data = PdfProcessor.extract_information(elements)
-            text_file_path = await extract_text(file_name, extracted_data)
+                extracted_data = PdfProcessor.extract_information(elements)
+                text_file_path = await extract_text(
+                    file_name, extracted_data, json_skills, json_designations
+                )
 
-            if not os.path.exists(f"{text_file_path}_extracted_info.json"):
-                return jsonify({"error": "File not found"}), 404
+                if not os.path.exists(f"{text_file_path}_extracted_info.json"):
+                    return jsonify({"error": "File not found"}), 404
 
-            return await send_json_to_api(filename=text_file_path)
+                extracted_info = await send_json_to_api(filename=text_file_path)
+                _cache_resume(resume_key, extracted_info)
+                return extracted_info
 
-        elif "pdf_url" in request.form:
-            pdf_url = request.form["pdf_url"]
-            file_name = os.path.basename(pdf_url)
-            os.makedirs(f"resume-data/{file_name}", exist_ok=True)
+            elif "pdf_url" in request.form:
+                pdf_url = request.form["pdf_url"]
+                file_name = os.path.basename(pdf_url)
+                os.makedirs(f"resume-data/{file_name}", exist_ok=True)
 
-            extracted_data = await PdfProcessor.process_pdf(pdf_url, filename=file_name)
+                local_pdf_path = os.path.join(
+                    "resume-data", file_name, f"{file_name}.pdf"
+                )
+                pdf_hash = await PdfProcessor.download_pdf_from_url(
+                    client, pdf_url, local_pdf_path
+                )
+                json_skills, json_designations, data_version = await fetch_remote_data(
+                    client
+                )
+                resume_key = f"{pdf_hash}:{data_version}"
+                if (extracted_info := _get_cached_resume(resume_key)) is not None:
+                    return extracted_info
+
+                extracted_data = PdfProcessor.process_pdf(local_pdf_path, pdf_hash)
 
-            text_file_path = await extract_text(file_name, extracted_data)
+                text_file_path = await extract_text(
+                    file_name, extracted_data, json_skills, json_designations
+                )
 
-            if not os.path.exists(f"{text_file_path}_extracted_info.json"):
-                return jsonify({"error": "File not found"}), 404
+                if not os.path.exists(f"{text_file_path}_extracted_info.json"):
+                    return jsonify({"error": "File not found"}), 404
 
-            return await send_json_to_api(filename=text_file_path)
-        else:
-            return jsonify({"error": "No file or PDF URL provided"}), 400
+                extracted_info = await send_json_to_api(filename=text_file_path)
+                _cache_resume(resume_key, extracted_info)
+                return extracted_info
+            else:
+                return jsonify({"error": "No file or PDF URL provided"}), 400
 
     except httpx.RequestError as e:
         return jsonify({"error": f"Error fetching or processing PDF: {str(e)}"}), 500
 
 
-async def extract_text(file_name: str, extracted_data: Dict[Any, Any]) -> str:
+async def fetch_remote_data(
+    client: httpx.AsyncClient,
+) -> tuple[list[Any] | None, list[Any], str]:
+    """
+    Fetches the skills and designations, waiting until the designations are available.
+
+    Args:
+        client (httpx.AsyncClient): The client of the view, as created by _http_client.
+
+    Returns:
+        tuple[list[Any] | None, list[Any], str]: The skills, the designations and the
+            version of both, which changes whenever either of them does.
+    """
+    output_file_path_skill = "skills-collection.json"
+    output_file_path_designation = "designations-collection.json"
+    acquired_skill_data, skill_version = await _fetch_remote_json(
+        client, URL_TO_FETCH_SKILL, output_file_path_skill
+    )
+
+    acquired_designation_data = None
+    while acquired_designation_data is None:
+        acquired_designation_data, designation_version = await _fetch_remote_json(
+            client, URL_TO_FETCH_DESIGNATION, output_file_path_designation
+        )
+        if acquired_designation_data is None:
+            print("Waiting for acquired_designation_data...")
+            await asyncio.sleep(2)  # Add a short delay before retrying
+
+    return (
+        acquired_skill_data,
+        acquired_designation_data,
+        f"{skill_version}:{designation_version}",
+    )
+
+
+async def extract_text(
+    file_name: str,
+    extracted_data: Dict[Any, Any],
+    json_skills: list[Any] | None,
+    json_designations: list[Any],
+) -> str:
     """
     Extracts text from the given extracted_data and saves it to a text file.
 
     Args:
         file_name (str): The name of the file.
         extracted_data (Dict[Any, Any]): The extracted data containing the text.
+        json_skills (list[Any] | None): The skills, as returned by fetch_remote_data.
+        json_designations (list[Any]): The designations, as returned by fetch_remote_data.
 
     Returns:
         str: The file path of the saved text file.
@@ -544,45 +761,26 @@ async def extract_text(file_name: str, extracted_data: Dict[Any, Any]) -> str:
 
     pdf_name = f"resume-data/{file_name}/{file_name}.txt"
 
-    with open(pdf_name, "w", encoding="utf-8", errors="replace") as f:
-        for line in text:
-            line = line.replace(
-                "", ""
-            )  # Replace dot symbol not recognized by the system
-            line = remove_unrecognized_characters(text=line)
-            if line is not None:
-                f.write(line + "\n")
-
-    output_file_path_skill = "skills-collection.json"
-    output_file_path_designation = "designations-collection.json"
-    text_file_path = pdf_name
-    acquired_skill_data = await save_url_as_json_async(
-        URL_TO_FETCH_SKILL, output_file_path_skill
-    )
-    skill_titles = (
-        [item["title"] for item in acquired_skill_data] if acquired_skill_data else []
+    cleaned_lines = (
+        # Replace dot symbol not recognized by the system
+        remove_unrecognized_characters(text=line.replace("", ""))
+        for line in text
     )
 
-    acquired_designation_data = None
-    while acquired_designation_data is None:
-        acquired_designation_data = await save_url_as_json_async(
-            URL_TO_FETCH_DESIGNATION, output_file_path_designation
-        )
-        if acquired_designation_data is None:
-            print("Waiting for acquired_designation_data...")
-            await asyncio.sleep(2)  # Add a short delay before retrying
+    with open(pdf_name, "w", encoding="utf-8", errors="replace") as f:
+        f.write("".join(f"{line}\n" for line in cleaned_lines if line is not None))
 
-    designation_titles = [
-        item.get("designation", "") for item in acquired_designation_data
-    ]
+    text_file_path = pdf_name
+    skill_titles = [item["title"] for item in json_skills] if json_skills else []
+    designation_titles = [item.get("designation", "") for item in json_designations]
 
     if skill_titles and designation_titles:
         await asyncio.gather(
             asyncio.create_task(
                 check_titles_and_extract_info(
                     text_file_path,
-                    acquired_skill_data,
-                    json_designations=acquired_designation_data,
+                    json_skills,
+                    json_designations=json_designations,
                 )
             ),
         )
@@ -9,23 +9,40 @@ List of Functions:
 - extract_experience_duration(text: str) -> tuple[float, str]: Extracts the numeric value and duration string from the given text using a regular expression pattern.
 - extract_experience_text(text: str) -> str | Any | None: Extracts the experience text from the given input text.
 - extract_summary_text(text_content: str) -> str | Any | None: Extracts the summary from the given text content.
+- extract_keywords(text_content: str, terms: Sequence[str], text_content_lc: str | None) -> list[tuple[int, str]]: Finds the terms that occur as whole words in the given text content.
+- extract_skills(text_content: str, skills: Sequence[str], text_content_lc: str | None) -> list[str]: Extracts the skills found in the given text content.
+- extract_designations(text_content: str, designations: Sequence[str], text_content_lc: str | None) -> list[str]: Extracts the designations found in the given text content, in the order they appear.
 
 List of Regex Patterns:
 - PINCODE_PATTERN: Regex pattern for pincode.
 - EMAIL_PATTERN: Regex pattern for email address.
 - PHONE_PATTERN: Regex pattern for phone number.
 - LINK_PATTERN: Regex pattern for link.
+- PINCODE_OR_PHONE_PATTERN: Regex pattern for pincodes and phone numbers, told apart by group name.
+- MASK_PATTERN: Regex pattern for links, emails, pincodes and phone numbers, masked in one pass.
+- CONTACT_MASK_PATTERN: Regex pattern for emails, pincodes and phone numbers, masked in one pass.
 - EXPERIENCE_DURATION_PATTERN: Regex pattern for experience duration.
-- NAME_PATTERN: Regex pattern for name.
-- EXPERIENCE_TEXT_PATTERN: Regex pattern for experience text.
-- SUMMARY_PATTERN: Regex pattern for summary.
+- NAME_PATTERN: Regex pattern for name (RE2).
+- NAME_NOISE_PATTERN: Regex pattern for LinkedIn labels and vercel.app links around the name.
+- NON_ASCII_PATTERN: Regex pattern for runs of non-ASCII characters.
+- UNICODE_ESCAPE_PATTERN: Regex pattern for literal \\uXXXX escapes.
+
+List of Section Headers:
+- EXPERIENCE_HEADERS / EXPERIENCE_TERMINATORS: Headers that start and end the experience text.
+- SUMMARY_HEADERS / SUMMARY_TERMINATORS: Headers that start and end the summary.
+- EXPERIENCE_AUTOMATON / SUMMARY_AUTOMATON: Aho-Corasick automatons finding both in one pass.
 
 """
 
 
-import codecs
 import re
-from typing import Any, Literal
+from bisect import bisect_left
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Literal, Sequence
+
+import ahocorasick  # type: ignore
+import re2  # type: ignore
 
 # All Regex Patterns
 PINCODE_PATTERN = re.compile(r"\b\d{6}\b")
@@ -34,29 +51,278 @@ EMAIL_PATTERN = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b
 
 PHONE_PATTERN = re.compile(r"(\+?\d{0,3}[-\s]?\d{10})")
 
-LINK_PATTERN = re.compile(r".*\.com.*\n?")
+# Anchored to line starts, which is the only place a match can begin anyway, so
+# lines without ".com" are rejected once instead of once per character
+LINK_PATTERN = re.compile(r"^.*\.com.*\n?", flags=re.MULTILINE)
+
+# Pincodes are matched only to be left alone, so their digits never start a phone number
+PINCODE_OR_PHONE_PATTERN = re.compile(
+    rf"(?P<pin>{PINCODE_PATTERN.pattern})|(?P<phone>{PHONE_PATTERN.pattern})"
+)
+
+CONTACT_MASK_PATTERN = re.compile(
+    rf"(?P<email>{EMAIL_PATTERN.pattern})|{PINCODE_OR_PHONE_PATTERN.pattern}"
+)
+
+# Separators dropped from a phone number
+PHONE_SEPARATORS = str.maketrans("", "", "- \n")
+
+MASK_PATTERN = re.compile(
+    rf"(?P<link>{LINK_PATTERN.pattern})|{CONTACT_MASK_PATTERN.pattern}",
+    flags=re.MULTILINE,
+)
+
+MASKS = {
+    "link": "<link masked>",
+    "email": "<email masked>",
+    "phone": "<phone no. masked>",
+}
 
 EXPERIENCE_DURATION_PATTERN = re.compile(
     r"(\d+(?:\.\d+)?)\s*(?:\+)?\s*(?:[yY]ears|[yY]ear|[mM]onths?)"
 )
 
-NAME_PATTERN = re.compile(
+# Compiled with RE2: under re, `.*?` and `\s*` backtrack quadratically on runs of spaces
+NAME_PATTERN = re2.compile(
     r"^(?:.*?(?:Name:\s*)?(?:Mrs\.|Mr\.|Miss|Ms\.)?\s*([A-Za-z]+)\s*([A-Za-z]+(?: [A-Za-z]+)*))\n?",
 )
 
-EXPERIENCE_TEXT_PATTERN = re.compile(
-    r"(EXPERIENCE|Experience|Projects Undertaken:|PROJECTS UNDERTAKEN|Projects:|PROJECTS|PROJECTS:|Work Experience:|EMPLOYMENT HISTORY|Projects|Project Details:|WORK EXPERIENCE :|Projects :|EXPERIENCE:|Project|Employment History|PR O F E S SI O NA L   E X P E R I E N C E|Work experience|PROFESSIONAL EXPERIENCE .|P R O J E C T S|JOBS|W O R K E X P E R I E N C E|Work History|PROJECT)\n([{L}\s\S]*?)(?=\n(?:SKILLS|Skills|Professional Skills|Personal Qualities:|PERSONAL QUALITIES:|Personal Qualities|PERSONAL QUALITIES|Education|EDUCATION|EXTRACURRICULAR ACTIVITIES|Languages|Certification|CERTIFICATE|Additional Information:|ACHIEVEMENTS|E D U C A TI O N|Interests|TECHNICAL SKILLS|SKILLS:|TRAINING|P R O J E C T S|S K I L L S|STRENGTHS|$))",
+NAME_NOISE_PATTERN = re.compile(
+    r"\bLinkedIn\b|\b\w+\.vercel\.app\b",
+    flags=re.IGNORECASE,
 )
 
-SUMMARY_PATTERN = re.compile(
-    r"(\bSummary|ABOUT|PROFILE|SUMMARY|INTRODUCTION|HEADLINE|PROFESSIONAL SUMMARY|About Me|PROFESSIONAL SUMMARY:|Synopsis|Proﬁle Summary:|Profile Summary:|My Projects|Summary|SUMMARY|Summary:|CAREER OBJECTIVE :|Objectives :|Projects:|Objectives|Objective|Profile|SUMMARY OF EXPERIENCE|OBJECTIVE|CAREER SUMMARY:|ABOUT ME|Objective:|P R O F E S S I O N A L   S U M M A R Y|CAREER OBJECTIVE:|P R O F I L E|Profile Summary & Skills|CAREER OBJECTIVE)\n?([\s\S]*?)(?=\n(?:CAREER OBJECTIVE|OBJECTIVE|GOAL|Education|EXPERIENCE SUMMARY|Current Company Details|Projects Undertaken|Experience|Skills|Contact|Technical Skills|Technical Expertise:|Professional Qualification|EMPLOYMENT HISTORY|Completed|EDUCATION|Projects|SKILLS|Languages|Current|PROFESSIONAL|WORK EXPERIENCE|PROFESSIONAL EXPERIENCE|T E C H N I C A L   S K I L L S|C O N T A C T M E|Work Experience|E D U C A T I O N|Professional Experience|Skills & Abilities|QUALIFICATION DETAILS|$)\b)",
-    flags=re.DOTALL,
+# Section headers are plain literals, found together with their terminators in one
+# Aho-Corasick pass instead of backtracking through long regex alternations.
+# The longest header wins at a given offset, so "Summary" does not cut "Summary:" short.
+EXPERIENCE_HEADERS = (
+    "EXPERIENCE",
+    "Experience",
+    "Projects Undertaken:",
+    "PROJECTS UNDERTAKEN",
+    "Projects:",
+    "PROJECTS",
+    "PROJECTS:",
+    "Work Experience:",
+    "EMPLOYMENT HISTORY",
+    "Projects",
+    "Project Details:",
+    "WORK EXPERIENCE :",
+    "Projects :",
+    "EXPERIENCE:",
+    "Project",
+    "Employment History",
+    "PR O F E S SI O NA L   E X P E R I E N C E",
+    "Work experience",
+    "PROFESSIONAL EXPERIENCE .",
+    "P R O J E C T S",
+    "JOBS",
+    "W O R K E X P E R I E N C E",
+    "Work History",
+    "PROJECT",
 )
 
+EXPERIENCE_TERMINATORS = (
+    "SKILLS",
+    "Skills",
+    "Professional Skills",
+    "Personal Qualities:",
+    "PERSONAL QUALITIES:",
+    "Personal Qualities",
+    "PERSONAL QUALITIES",
+    "Education",
+    "EDUCATION",
+    "EXTRACURRICULAR ACTIVITIES",
+    "Languages",
+    "Certification",
+    "CERTIFICATE",
+    "Additional Information:",
+    "ACHIEVEMENTS",
+    "E D U C A TI O N",
+    "Interests",
+    "TECHNICAL SKILLS",
+    "SKILLS:",
+    "TRAINING",
+    "P R O J E C T S",
+    "S K I L L S",
+    "STRENGTHS",
+)
+
+SUMMARY_HEADERS = (
+    "Summary",
+    "ABOUT",
+    "PROFILE",
+    "SUMMARY",
+    "INTRODUCTION",
+    "HEADLINE",
+    "PROFESSIONAL SUMMARY",
+    "About Me",
+    "PROFESSIONAL SUMMARY:",
+    "Synopsis",
+    "Proﬁle Summary:",
+    "Profile Summary:",
+    "My Projects",
+    "Summary:",
+    "CAREER OBJECTIVE :",
+    "Objectives :",
+    "Projects:",
+    "Objectives",
+    "Objective",
+    "Profile",
+    "SUMMARY OF EXPERIENCE",
+    "OBJECTIVE",
+    "CAREER SUMMARY:",
+    "ABOUT ME",
+    "Objective:",
+    "P R O F E S S I O N A L   S U M M A R Y",
+    "CAREER OBJECTIVE:",
+    "P R O F I L E",
+    "Profile Summary & Skills",
+    "CAREER OBJECTIVE",
+)
+
+SUMMARY_TERMINATORS = (
+    "CAREER OBJECTIVE",
+    "OBJECTIVE",
+    "GOAL",
+    "Education",
+    "EXPERIENCE SUMMARY",
+    "Current Company Details",
+    "Projects Undertaken",
+    "Experience",
+    "Skills",
+    "Contact",
+    "Technical Skills",
+    "Technical Expertise:",
+    "Professional Qualification",
+    "EMPLOYMENT HISTORY",
+    "Completed",
+    "EDUCATION",
+    "Projects",
+    "SKILLS",
+    "Languages",
+    "Current",
+    "PROFESSIONAL",
+    "WORK EXPERIENCE",
+    "PROFESSIONAL EXPERIENCE",
+    "T E C H N I C A L   S K I L L S",
+    "C O N T A C T M E",
+    "Work Experience",
+    "E D U C A T I O N",
+    "Professional Experience",
+    "Skills & Abilities",
+    "QUALIFICATION DETAILS",
+)
+
+
+NON_ASCII_PATTERN = re.compile(r"[^\x00-\x7F]+")
+
+UNICODE_ESCAPE_PATTERN = re.compile(r"\\u([0-9a-fA-F]{4})")
+
 URL_TO_FETCH_SKILL = "https://api.npoint.io/81a5d37fea0d63fea458"
 URL_TO_FETCH_DESIGNATION = "https://api.npoint.io/5bb9a9836361d1fc9396"
 
 
+def _is_word_boundary(text: str, index: int) -> bool:
+    """
+    Checks whether the given index is a word boundary, with the same meaning as `\\b` in `re`.
+
+    Args:
+        text (str): The text to check.
+        index (int): The position between two characters of the text.
+
+    Returns:
+        bool: True if exactly one of the neighbouring characters is a word character.
+    """
+    before = index > 0 and (text[index - 1].isalnum() or text[index - 1] == "_")
+    after = index < len(text) and (text[index].isalnum() or text[index] == "_")
+    return before != after
+
+
+def _section_automaton(
+    headers: tuple[str, ...], terminators: tuple[str, ...], terminator_boundary: bool
+) -> ahocorasick.Automaton:
+    """
+    Builds an automaton that finds section headers and terminators in a single pass.
+
+    Args:
+        headers (tuple[str, ...]): The headers starting the section. A trailing "." matches any one character.
+        terminators (tuple[str, ...]): The headers ending the section, matched right after a newline.
+        terminator_boundary (bool): Whether a terminator must be followed by a word boundary.
+
+    Returns:
+        ahocorasick.Automaton: Headers map to (rank, length, wildcards), ranked longest first,
+        and terminators to (None, length, terminator_boundary).
+    """
+    automaton = ahocorasick.Automaton()
+    for rank, header in enumerate(sorted(headers, key=len, reverse=True)):
+        literal = header.rstrip(".")
+        automaton.add_word(literal, (rank, len(literal), len(header) - len(literal)))
+    for terminator in terminators:
+        key = f"\n{terminator}"
+        automaton.add_word(key, (None, len(key), terminator_boundary))
+    automaton.make_automaton()
+    return automaton
+
+
+EXPERIENCE_AUTOMATON = _section_automaton(
+    EXPERIENCE_HEADERS, EXPERIENCE_TERMINATORS, terminator_boundary=False
+)
+
+SUMMARY_AUTOMATON = _section_automaton(
+    SUMMARY_HEADERS, SUMMARY_TERMINATORS, terminator_boundary=True
+)
+
+
+def _find_section(
+    text: str,
+    automaton: ahocorasick.Automaton,
+    newline_required: bool,
+    until_end: bool,
+) -> str | None:
+    """
+    Finds the text between the first section header and the next terminator.
+
+    Args:
+        text (str): The text to search.
+        automaton (ahocorasick.Automaton): The automaton built by _section_automaton.
+        newline_required (bool): Whether the header must be followed by a newline, otherwise one is skipped if present.
+        until_end (bool): Whether a trailing newline also ends the section when no terminator follows.
+
+    Returns:
+        str | None: The section text, or None if no header is followed by a terminator.
+    """
+    headers: list[tuple[int, int, int]] = []
+    terminator_starts: list[int] = []
+    for end, (rank, length, extra) in automaton.iter(text):
+        start = end - length + 1
+        if rank is None:
+            if not extra or _is_word_boundary(text, end + 1):
+                terminator_starts.append(start)
+            continue
+        header_end = end + 1 + extra
+        # Wildcards match any character but a newline
+        if header_end <= len(text) and "\n" not in text[end + 1 : header_end]:
+            headers.append((start, rank, header_end))
+
+    if until_end and text.endswith("\n"):
+        terminator_starts.append(len(text) - 1)
+        if text.endswith("\n\n"):
+            terminator_starts.append(len(text) - 2)
+    terminator_starts.sort()
+
+    for _, _, header_end in sorted(headers):
+        if text.startswith("\n", header_end):
+            index = bisect_left(terminator_starts, header_end + 1)
+            if index < len(terminator_starts):
+                return text[header_end + 1 : terminator_starts[index]]
+        if not newline_required:
+            index = bisect_left(terminator_starts, header_end)
+            if index < len(terminator_starts):
+                return text[header_end : terminator_starts[index]]
+    return None
+
+
 def extract_email(text_content: str) -> str | None:
     """
     Extracts an email address from the given text content.
@@ -81,19 +347,11 @@ def extract_phone(text_content: str) -> str | Any | None:
     Returns:
         str | Any | None: The extracted phone number, or None if no phone number is found.
     """
-    pincode = re.search(PINCODE_PATTERN, text_content)
-    try:
-        if pincode:
-            text_content = text_content.replace(pincode[0], "")
-        else:
-            text_content = text_content
-    except Exception as e:
-        print("Exception", e)
+    for match in PINCODE_OR_PHONE_PATTERN.finditer(text_content):
+        if match.lastgroup != "phone":
+            continue
 
-    if match := re.search(PHONE_PATTERN, text_content):
-        phone_number = (
-            match.group(1).replace("-", "").replace(" ", "").replace("\n", "")
-        )
+        phone_number = match["phone"].translate(PHONE_SEPARATORS)
 
         if len(phone_number) > 10:  # Check if country code is present
             return f"{phone_number[:-10]} {phone_number[-10:]}"
@@ -103,6 +361,22 @@ def extract_phone(text_content: str) -> str | Any | None:
     return None
 
 
+def _mask(match: re.Match[str]) -> str:
+    """
+    Replaces a match of MASK_PATTERN or CONTACT_MASK_PATTERN with its mask.
+
+    Args:
+        match (re.Match[str]): The match to replace.
+
+    Returns:
+        str: The mask for the matched group, or the matched text for a pincode.
+    """
+    if match.lastgroup == "phone" and match[0][0].isspace():
+        # The optional separator of a number without country code is the space before it
+        return match[0][0] + MASKS["phone"]
+    return MASKS.get(match.lastgroup or "", match[0])
+
+
 def extract_summary_text(text_content: str) -> str | Any | None:
     """
     Extracts the summary text from the given text content.
@@ -113,34 +387,23 @@ def extract_summary_text(text_content: str) -> str | Any | None:
     Returns:
         str | Any | None: The extracted summary text, or None if no summary is found.
     """
-    email = extract_email(text_content)
-    phone = extract_phone(text_content)
-    links = re.finditer(LINK_PATTERN, text_content)
-    links = [i.group(0) for i in links]
-    if links:
-        for link in links:
-            text_content = text_content.replace(link, "<link masked>")
-
-    try:
-        if email and phone:
-            text_content = text_content.replace(phone, "<phone no. masked>").replace(
-                email, "<email masked>"
-            )
-        elif email:
-            text_content = text_content.replace(email, "<email masked>")
-        elif phone:
-            text_content = text_content.replace(phone, "<phone no. masked>")
-        else:
-            text_content = text_content
-    except Exception as e:
-        print("Exception", e)
-
-    match = SUMMARY_PATTERN.search(text_content.strip())
-    summary = match[2].strip() if match else None
-    summary = codecs.decode(summary, "unicode-escape") if summary else None
+    text_content = MASK_PATTERN.sub(_mask, text_content)
+
+    summary = _find_section(
+        text_content.strip(), SUMMARY_AUTOMATON, newline_required=False, until_end=False
+    )
+    summary = summary.strip() if summary else None
+    if not summary:
+        return None
+
+    # Only literal \uXXXX escapes are decoded, the rest of the text is already Unicode
+    if "\\u" in summary:
+        summary = UNICODE_ESCAPE_PATTERN.sub(
+            lambda match: chr(int(match[1], 16)), summary
+        )
 
     # If a match is found, return the content after the first PROFILE paragraph
-    return summary.replace('"\\"', "").replace('\\""', "") if summary else None
+    return summary
 
 
 def extract_experience_duration(
@@ -175,24 +438,131 @@ def extract_experience_text(text_content: str) -> str | Any | None:
     Returns:
         str | Any | None: The extracted experience text, or None if no match is found.
     """
-    email = extract_email(text_content)
-    phone = extract_phone(text_content)
-    try:
-        if email and phone:
-            text_content = text_content.replace(phone, "<phone no. masked>").replace(
-                email, "<email masked>"
-            )
-        elif email:
-            text_content = text_content.replace(email, "<email masked>")
-        elif phone:
-            text_content = text_content.replace(phone, "<phone no. masked>")
-        else:
-            text_content = text_content
-    except Exception as e:
-        print("Exception", e)
+    text_content = CONTACT_MASK_PATTERN.sub(_mask, text_content)
 
-    # Define the regex pattern
-    match = EXPERIENCE_TEXT_PATTERN.search(text_content)
+    experience = _find_section(
+        text_content, EXPERIENCE_AUTOMATON, newline_required=True, until_end=True
+    )
 
     # If a match is found, return the content after the first PROFILE paragraph
-    return match[2].strip() if match else None
+    return experience.strip() if experience is not None else None
+
+
+@lru_cache(maxsize=8)
+def _keyword_index(
+    terms: tuple[str, ...],
+) -> tuple[ahocorasick.Automaton, tuple[str, ...]]:
+    """
+    Lowercases the terms and builds an Aho-Corasick automaton over them.
+
+    Args:
+        terms (tuple[str, ...]): The terms to match, as loaded from the JSON data.
+
+    Returns:
+        tuple[ahocorasick.Automaton, tuple[str, ...]]: The automaton and the lowercased terms
+            in the same order, cached for as long as the terms stay the same.
+    """
+    keywords = tuple(term.lower() for term in terms)
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        if keyword:
+            automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton, keywords
+
+
+def _find_keyword_offsets(
+    text_lc: str, automaton: ahocorasick.Automaton
+) -> dict[str, int]:
+    """
+    Finds the whole-word occurrences of the automaton's keywords in a single pass.
+
+    Args:
+        text_lc (str): The lowercased text content to search.
+        automaton (ahocorasick.Automaton): The automaton built by _keyword_index.
+
+    Returns:
+        dict[str, int]: The offset of the first occurrence of each found keyword.
+    """
+    if automaton.kind != ahocorasick.AHOCORASICK:
+        return {}
+
+    first_offsets: dict[str, int] = {}
+    for end, keyword in automaton.iter(text_lc):
+        start = end - len(keyword) + 1
+        if (
+            keyword not in first_offsets
+            and _is_word_boundary(text_lc, start)
+            and _is_word_boundary(text_lc, end + 1)
+        ):
+            first_offsets[keyword] = start
+    return first_offsets
+
+
+def extract_keywords(
+    text_content: str, terms: Sequence[str], text_content_lc: str | None = None
+) -> list[tuple[int, str]]:
+    """
+    Finds the terms that occur as whole words in the text content, ignoring case.
+
+    Args:
+        text_content (str): The text content to search.
+        terms (Sequence[str]): The terms to match, as loaded from the JSON data.
+        text_content_lc (str | None, optional): The text content already lowercased. Defaults to None.
+
+    Returns:
+        list[tuple[int, str]]: The offset of the first occurrence and the term, for each
+            found term, in the order of the terms.
+    """
+    terms = tuple(terms)
+    automaton, terms_lc = _keyword_index(terms)
+    found = _find_keyword_offsets(text_content_lc or text_content.lower(), automaton)
+    if not found:
+        return []
+
+    return [
+        (found[term_lc], term)
+        for term, term_lc in zip(terms, terms_lc)
+        if term_lc in found
+    ]
+
+
+def extract_skills(
+    text_content: str, skills: Sequence[str], text_content_lc: str | None = None
+) -> list[str]:
+    """
+    Extracts the skills found in the given text content.
+
+    Args:
+        text_content (str): The text content to extract the skills from.
+        skills (Sequence[str]): The skill titles to look for.
+        text_content_lc (str | None, optional): The text content already lowercased. Defaults to None.
+
+    Returns:
+        list[str]: The skills found in the text content, in the order of the skill titles.
+    """
+    return [
+        skill for _, skill in extract_keywords(text_content, skills, text_content_lc)
+    ]
+
+
+def extract_designations(
+    text_content: str, designations: Sequence[str], text_content_lc: str | None = None
+) -> list[str]:
+    """
+    Extracts the designations found in the given text content.
+
+    Args:
+        text_content (str): The text content to extract the designations from.
+        designations (Sequence[str]): The designations to look for.
+        text_content_lc (str | None, optional): The text content already lowercased. Defaults to None.
+
+    Returns:
+        list[str]: The designations found in the text content, in the order they first appear.
+    """
+    matches = extract_keywords(text_content, designations, text_content_lc)
+
+    # Sort the matching designations based on their appearance in the text
+    if len(matches) > 1:
+        matches.sort(key=itemgetter(0))
+    return [designation for _, designation in matches]
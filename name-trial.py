@@ -1,10 +1,11 @@
-import scrubadub
+from main_config import NAME_PATTERN
 
-scrubber = scrubadub.Scrubber()
-scrubber.add_detector(scrubadub.detectors.TextBlobNameDetector)
-name = scrubber.clean(
-    "Profile Name Role Address Syed HarisKosar Ali Software Programmer Bhopal – House no. 10, Baramahal, opposite to Old Civil Court Profile"
-)
+text = "Profile Name Role Address Syed HarisKosar Ali Software Programmer Bhopal – House no. 10, Baramahal, opposite to Old Civil Court Profile"
+
+# The name is looked for on the first non-empty line only
+first_line = next((line for line in text.splitlines() if line.strip()), "")
+match = NAME_PATTERN.search(first_line)
+name = f"{match.group(1)} {match.group(2)}" if match else None
 
 
 print(name)
@@ -2,56 +2,194 @@
 Contains high level functions for PDF conversion.
 
 List of functions:
-- extract_text_line_by_line(pdf_path: str) -> list: Extracts text from a PDF file and returns it as a list of lines.
-- extract_with_unstructured(pdf_path: str) -> str: Extracts text from a PDF using an unstructured approach.
+- extract_text_line_by_line(pdf_path: str | BinaryIO, pdf_hash: str | None) -> list: Extracts text from a PDF file and returns it as a list of lines.
+- iter_text_lines(pdf_path: str | BinaryIO) -> Iterator[str]: Yields the lines of a PDF file, extracting one page at a time.
+- extract_with_unstructured(pdf_path: str | BinaryIO) -> str: Extracts text from a PDF using an unstructured approach.
+- extract_with_pytesseract(pdf_path: str | BinaryIO) -> str: Extracts text from a PDF using PyTesseract.
 
 """
 
-import re
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from typing import Any, BinaryIO, Iterable, Iterator
 
 import pytesseract
-from pdf2image import convert_from_path
-from pdfminer.high_level import extract_text
+from pdf2image import convert_from_bytes, convert_from_path
+from pdfminer.converter import TextConverter
+from pdfminer.layout import LAParams
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
+from pdfminer.utils import open_filename
 from unstructured.partition.pdf import partition_pdf  # type: ignore
 
+# Letters a text layer must have to be used. Below this a PDF is treated as scanned, even
+# if it has a few stray text objects, and OCR is tried before the unstructured layout model
+MIN_TEXT_LETTERS = 200
 
-def extract_text_line_by_line(pdf_path: str) -> list[str] | None:
+# Threads an OpenMP build of tesseract runs per process unless OMP_THREAD_LIMIT is set
+TESSERACT_THREADS = 4
+
+# Maximum number of PDF files whose lines are kept in memory
+TEXT_LINES_CACHE_SIZE = 64
+
+# PDF content hash -> extracted lines, least recently used first
+_TEXT_LINES_CACHE: OrderedDict[str, tuple[str, ...]] = OrderedDict()
+_TEXT_LINES_CACHE_LOCK = threading.Lock()
+
+
+def extract_text_line_by_line(
+    pdf_path: str | BinaryIO, pdf_hash: str | None = None
+) -> list[str] | None:
     """
     Extracts text from a PDF file and returns it as a list of lines.
 
+    The lines are cached by the hash of the PDF content when one is given, so a PDF
+    with the same content is only extracted once.
+
     Args:
-        pdf_path (str): The path to the PDF file.
+        pdf_path (str | BinaryIO): The path to the PDF file, or the PDF file opened in binary mode.
+        pdf_hash (str | None, optional): The hash of the PDF content. Defaults to None, which skips the cache.
 
     Returns:
         list[str] | None: A list of text lines extracted from the PDF file, or None if an error occurs.
     """
     try:
-        text = extract_text(pdf_path)
-
-        if not text.strip():
-            text = extract_with_unstructured(pdf_path)
+        if pdf_hash is None:
+            return list(iter_text_lines(pdf_path))
 
-        lines = text.split("\n")
-        return [re.sub(r"\s+", " ", line).strip() for line in lines if line.strip()]
+        with _TEXT_LINES_CACHE_LOCK:
+            lines = _TEXT_LINES_CACHE.get(pdf_hash)
+            if lines is not None:
+                _TEXT_LINES_CACHE.move_to_end(pdf_hash)
+        if lines is None:
+            lines = tuple(iter_text_lines(pdf_path))
+            with _TEXT_LINES_CACHE_LOCK:
+                _TEXT_LINES_CACHE[pdf_hash] = lines
+                if len(_TEXT_LINES_CACHE) > TEXT_LINES_CACHE_SIZE:
+                    _TEXT_LINES_CACHE.popitem(last=False)
+        return list(lines)
     except Exception as e:
         print(f"Error: {e}")
         return None
 
 
-def extract_with_unstructured(pdf_path: str) -> str:
+def iter_text_lines(pdf_path: str | BinaryIO) -> Iterator[str]:
+    """
+    Extracts text from a PDF file one page at a time and yields it line by line.
+
+    Lines are held back until MIN_TEXT_LETTERS letters are found. If the text layer has
+    fewer, PyTesseract and then the unstructured approach are tried, and the text with
+    the most letters is used. A fallback that fails is skipped.
+
+    Args:
+        pdf_path (str | BinaryIO): The path to the PDF file, or the PDF file opened in binary mode.
+
+    Yields:
+        str: The non-empty lines of the PDF file, with whitespace collapsed.
+    """
+    lines = _iter_pdfminer_lines(pdf_path)
+    held_lines: list[str] = []
+    letters = 0
+    for line in lines:
+        held_lines.append(line)
+        letters += sum(map(str.isalpha, line))
+        if letters > MIN_TEXT_LETTERS:
+            yield from held_lines
+            yield from lines
+            return
+
+    text = "\n".join(held_lines)
+    for extract in (extract_with_pytesseract, extract_with_unstructured):
+        try:
+            fallback_text = extract(pdf_path)
+        except Exception as e:
+            # A missing tesseract or poppler must not lose the text pdfminer found
+            print(f"Error: {extract.__name__} failed: {e}")
+            continue
+        fallback_letters = sum(map(str.isalpha, fallback_text))
+        if fallback_letters > letters:
+            text, letters = fallback_text, fallback_letters
+        if letters > MIN_TEXT_LETTERS:
+            break
+
+    yield from _clean_lines(text.split("\n"))
+
+
+def _iter_pdfminer_lines(pdf_path: str | BinaryIO) -> Iterator[str]:
+    """
+    Yields the lines pdfminer extracts from a PDF file, holding only one page of text at a time.
+
+    Args:
+        pdf_path (str | BinaryIO): The path to the PDF file, or the PDF file opened in binary mode.
+
+    Yields:
+        str: The non-empty lines of the PDF file, with whitespace collapsed.
+    """
+    with open_filename(pdf_path, "rb") as pdf_file, StringIO() as page_text:
+        resource_manager = PDFResourceManager(caching=True)
+        device = TextConverter(resource_manager, page_text, laparams=LAParams())
+        interpreter = PDFPageInterpreter(resource_manager, device)
+
+        # A page need not end with a newline, its last line then continues on the next page
+        partial_line = ""
+        for page in PDFPage.get_pages(pdf_file, caching=True):
+            interpreter.process_page(page)
+            *lines, partial_line = (partial_line + page_text.getvalue()).split("\n")
+            page_text.seek(0)
+            page_text.truncate()
+            yield from _clean_lines(lines)
+
+        yield from _clean_lines([partial_line])
+
+
+def _clean_lines(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Collapses the whitespace in each line and skips the empty ones.
+
+    Args:
+        lines (Iterable[str]): The lines to clean.
+
+    Returns:
+        Iterator[str]: The cleaned non-empty lines.
+    """
+    return (" ".join(line.split()) for line in lines if line.strip())
+
+
+def extract_with_unstructured(pdf_path: str | BinaryIO) -> str:
     """
     Extracts text from a PDF file using an unstructured approach.
 
     Args:
-        pdf_path (str): The path to the PDF file.
+        pdf_path (str | BinaryIO): The path to the PDF file, or the PDF file opened in binary mode.
+
+    Returns:
+        str: The extracted text from the PDF file.
+    """
+    if isinstance(pdf_path, str):
+        return _partition_text(filename=pdf_path)
+
+    pdf_path.seek(0)  # May already have been read by pdfminer
+    return _partition_text(file=pdf_path)
+
+
+def _partition_text(**source: Any) -> str:
+    """
+    Partitions a PDF file with unstructured and joins the elements into text.
+
+    Args:
+        **source (Any): Either filename or file, as accepted by partition_pdf.
 
     Returns:
         str: The extracted text from the PDF file.
     """
     elements = partition_pdf(
-        pdf_path,
+        **source,
         include_page_breaks=True,
-        hi_res_model_name="yolox",
+        hi_res_model_name="yolox_quantized",
         strategy="hi_res",
         infer_table_structure=True,
         languages=["eng"],
@@ -66,23 +204,54 @@ def extract_with_unstructured(pdf_path: str) -> str:
 #     text_file.write(text)
 
 
-def extract_with_pytesseract(pdf_path: str) -> str:
+def extract_with_pytesseract(pdf_path: str | BinaryIO) -> str:
     """
     Extracts text from a PDF file using PyTesseract.
 
+    Pages are rendered to a temporary folder and recognised in parallel. Each page runs in
+    its own tesseract process, so threads are enough to keep every core busy. Every process
+    runs its own OpenMP threads, so fewer pages than cores are recognised at once unless
+    OMP_THREAD_LIMIT=1 is set for the server.
+
     Args:
-        pdf_path (str): The path to the PDF file.
+        pdf_path (str | BinaryIO): The path to the PDF file, or the PDF file opened in binary mode.
 
     Returns:
         str: The extracted text from the PDF file.
     """
-    images = convert_from_path(pdf_path)
-    return "".join(
-        pytesseract.image_to_string(image, config="--psm 6") for image in images
-    )
+    cpu_count = os.cpu_count() or 1
+    tesseract_threads = int(os.environ.get("OMP_THREAD_LIMIT") or TESSERACT_THREADS)
+    workers = max(1, cpu_count // max(1, tesseract_threads))
+    with tempfile.TemporaryDirectory() as output_folder:
+        options: dict[str, Any] = {
+            "output_folder": output_folder,
+            "paths_only": True,
+            "thread_count": cpu_count,
+        }
+        if isinstance(pdf_path, str):
+            page_paths = convert_from_path(pdf_path, **options)
+        else:
+            pdf_path.seek(0)  # May already have been read by pdfminer
+            page_paths = convert_from_bytes(pdf_path.read(), **options)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return "".join(executor.map(_ocr_page, page_paths))
+
+
+def _ocr_page(page_path: str) -> str:
+    """
+    Recognises the text of one rendered page with PyTesseract.
+
+    Args:
+        page_path (str): The path to the page image.
+
+    Returns:
+        str: The text of the page.
+    """
+    return pytesseract.image_to_string(page_path, config="--psm 6")
 
 
-pytesseract_text = extract_with_pytesseract("AAi Div.pdf")
-# Save the text in a text file
-with open("pytesseract_text.txt", "w") as text_file:
-    text_file.write(pytesseract_text)
+if __name__ == "__main__":
+    pytesseract_text = extract_with_pytesseract("AAi Div.pdf")
+    # Save the text in a text file
+    with open("pytesseract_text.txt", "w") as text_file:
+        text_file.write(pytesseract_text)
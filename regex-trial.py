@@ -1,15 +1,18 @@
+import re
+
+# Define the regex pattern for extracting the name
+NAME_PATTERN = re.compile(
+    r"^(?:.*?(?:Mrs\.|Mr\.|Miss|Ms\.|(?:Name:))?\s*([A-Za-z]+)\s*([A-Za-z]+(?: [A-Za-z]+)*))",
+)
+
+
 def extract_name(text_content, json_data: list):
     designation = check_and_collect_designation(text_content, json_data)
 
     cleaned_text = text_content.replace(designation[0], " ").replace("–", "").strip()
 
-    # Define the regex pattern for extracting the name
-    name_pattern = re.compile(
-        r"^(?:.*?(?:Mrs\.|Mr\.|Miss|Ms\.|(?:Name:))?\s*([A-Za-z]+)\s*([A-Za-z]+(?: [A-Za-z]+)*))",
-    )
-
     # Search for the pattern in the cleaned text
-    match = name_pattern.search(string=cleaned_text)
+    match = NAME_PATTERN.search(string=cleaned_text)
 
     # Check if a match is found
     if match:
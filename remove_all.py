@@ -1,17 +1,14 @@
-import json
+import orjson
 
 
 def keep_only_title(json_file_path: str):
-    with open(json_file_path, "r") as file:
-        data = json.load(file)
+    with open(json_file_path, "rb") as file:
+        data = orjson.loads(file.read())
 
-    for item in data:
-        title_value = item.get("title")
-        item.clear()
-        item["title"] = title_value
+    data = [{"title": item.get("title")} for item in data]
 
-    with open(json_file_path, "w") as file:
-        json.dump(data, file, indent=2)
+    with open(json_file_path, "wb") as file:
+        file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
 
 # Usage example
@@ -19,13 +16,17 @@ keep_only_title("skills-collection.json")
 
 
 def extract_titles(json_file_path):
-    with open(json_file_path, "r") as file:
-        data = json.load(file)
+    with open(json_file_path, "rb") as file:
+        data = orjson.loads(file.read())
 
-    titles = [{"title": item["title"]} for item in data if "title" in item]
+    # dict.fromkeys drops repeated titles and keeps the first-seen order
+    titles = [
+        {"title": title}
+        for title in dict.fromkeys(item["title"] for item in data if "title" in item)
+    ]
 
-    with open("output.json", "w") as output_file:
-        json.dump(titles, output_file, indent=2)
+    with open("output.json", "wb") as output_file:
+        output_file.write(orjson.dumps(titles, option=orjson.OPT_INDENT_2))
 
 
 extract_titles("skills-collection.json")
@@ -1,42 +1,35 @@
+import os
+
+import orjson
 import pandas as pd
-from tqdm import tqdm
 
 # Assuming your Excel file is in the same directory as this script
 excel_file_path = "BNI Data all india.xlsx"
 sheet_name = "india-members"
-
-# Read the Excel file
-df = pd.read_excel(excel_file_path, sheet_name=sheet_name)
+parquet_file_path = "bni.parquet"
+
+# Read the 'id' column from the Parquet copy, unless the Excel file is newer
+if os.path.exists(parquet_file_path) and os.path.getmtime(
+    parquet_file_path
+) >= os.path.getmtime(excel_file_path):
+    df = pd.read_parquet(parquet_file_path, columns=["id"])
+else:
+    # Parse only the 'id' column of the Excel file and keep a Parquet copy of it
+    df = pd.read_excel(
+        excel_file_path, sheet_name=sheet_name, usecols=["id"], engine="openpyxl"
+    )
+    df.to_parquet(parquet_file_path)
 
 # Extract the 'id' column
 id_column = df["id"]
 
 # Convert the 'id' column to a list and then to a dictionary
-id_data = id_column.tolist()
+id_data = id_column.to_numpy().tolist()
 
-# Save the data to a JSON file with tqdm progress bar
+# Save the data to a JSON file in a single serialization pass
 json_file_path = "uid_data.json"
 
-# Create a tqdm instance with the total number of items
-with tqdm(total=len(id_data), desc="Writing to JSON", unit="item") as pbar:
-    # Open the file in write mode
-    with open(json_file_path, "w") as json_file:
-        json_file.write('{"id": [')
-
-        # Loop through the 'id_data' list
-        for i, item in enumerate(id_data):
-            # Write the item to the file
-            json_file.write(str(item))
-
-            # Add a comma if it's not the last item
-            if i < len(id_data) - 1:
-                json_file.write(", ")
-
-            # Update the progress bar
-            pbar.update(1)
-
-        # Complete the JSON structure
-        json_file.write("]}")
+with open(json_file_path, "wb") as json_file:
+    json_file.write(orjson.dumps({"id": id_data}))
 
-# Print a newline after the progress bar is complete
-print("\nWriting to JSON complete!")
+print("Writing to JSON complete!")
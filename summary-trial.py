@@ -1,15 +1,15 @@
 import re
 
+# Define the regex pattern
+PROFILE_PATTERN = re.compile(
+    r"(?i)\b(?:Profile|Summary|Objective|Career Objective|Professional Summary|About Me)\b(?:.*?\n\n(.+?)(?=\n\n|$))?",
+    re.DOTALL,
+)
 
-def extract_profile(text_content):
-    # Define the regex pattern
-    profile_pattern = re.compile(
-        r"(?i)\b(?:Profile|Summary|Objective|Career Objective|Professional Summary|About Me)\b(?:.*?\n\n(.+?)(?=\n\n|$))?",
-        re.DOTALL,
-    )
 
+def extract_profile(text_content):
     # Search for the profile pattern in the text
-    matches = profile_pattern.findall(text_content)
+    matches = PROFILE_PATTERN.findall(text_content)
 
     # If matches are found, return a list of extracted profiles, otherwise return None
     return [match.strip() for match in matches if match] if matches else None
@@ -1,23 +1,19 @@
-import json
+import orjson
 
 
 def remove_duplicates_and_save(file_path):
-    with open(file_path, "r") as file:
-        json_data = json.load(file)
-
-    unique_designations = set()
-    unique_json_data = []
+    with open(file_path, "rb") as file:
+        json_data = orjson.loads(file.read())
 
+    # Keyed by designation, setdefault keeps the first item of each in first-seen order
+    unique_designations = {}
     for item in json_data:
-        designation = item.get("title")
-
-        # Check if the designation is not in the set (not a duplicate)
-        if designation not in unique_designations:
-            unique_designations.add(designation)
-            unique_json_data.append(item)
+        unique_designations.setdefault(item.get("title"), item)
 
-    with open(file_path, "w") as file:
-        json.dump(unique_json_data, file, indent=2)
+    with open(file_path, "wb") as file:
+        file.write(
+            orjson.dumps(list(unique_designations.values()), option=orjson.OPT_INDENT_2)
+        )
 
 
 remove_duplicates_and_save("output.json")